@@ -6,13 +6,9 @@
 
 import pytest
 from pytest_bdd import scenarios, given, when, then, parsers
-import json
 
-# Importaciones locales
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), "../../../.."))
-from Utils.api_utils import get, extract_data
+# Importaciones locales (el conftest.py raíz añade el proyecto a sys.path)
+from Utils.api_utils import get, head, extract_data, parse_json_response
 
 # ================================================================================================================================================ #
 # CONSTANTS
@@ -30,29 +26,71 @@ scenarios('../features/api_test.feature')
 # FIXTURES
 # ================================================================================================================================================ #
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def api_response():
-    """Fixture para almacenar la respuesta de la API entre pasos."""
+    """Fixture para almacenar la respuesta de la API entre pasos.
+
+    Tiene scope de módulo para no recrear el diccionario por escenario; la fixture
+    `clear_api_response` lo vacía entre tests para que no se filtre estado mutable.
+    """
     return {}
 
+@pytest.fixture(autouse=True)
+def clear_api_response(api_response):
+    """Vacía el diccionario de respuesta compartido antes de cada escenario."""
+    api_response.clear()
+
+@pytest.fixture(scope="module")
+def api_cache():
+    """Caché de respuestas compartida por los escenarios del módulo.
+
+    Solo se cachean peticiones GET (idempotentes), con clave (método, endpoint);
+    si un test llegara a mutar datos en la API, debería invalidar la entrada.
+    """
+    return {}
+
+@pytest.fixture(scope="session")
+def api_reachable():
+    """Comprueba la conectividad con la API una única vez por sesión.
+
+    Los escenarios posteriores reutilizan el resultado sin repetir la petición.
+    Se usa HEAD: la señal de alcanzabilidad es la misma que con GET, sin descargar el cuerpo.
+    """
+    response = head("", base_url=API_BASE_URL)
+    assert response.status_code < 400, "No se puede acceder a la API de JSONPlaceholder"
+    return True
+
 # ================================================================================================================================================ #
 # STEP DEFINITIONS
 # ================================================================================================================================================ #
 
 @given("que tengo acceso a la API de JSONPlaceholder")
-def access_api():
-    """Verificar que tenemos acceso a la API."""
-    # Este paso es principalmente declarativo, pero podríamos verificar la conectividad
-    response = get("", base_url=API_BASE_URL)
-    assert response.status_code < 400, "No se puede acceder a la API de JSONPlaceholder"
+def access_api(api_reachable):
+    """Verificar que tenemos acceso a la API.
+
+    La comprobación real la hace la fixture `api_reachable` una sola vez por sesión;
+    este paso solo depende de ella, sin lanzar peticiones adicionales.
+    """
+    assert api_reachable
 
 @when(parsers.parse('realizo una petición GET al endpoint "{endpoint}"'))
-def make_get_request(api_response, endpoint):
-    """Realizar una petición GET al endpoint especificado."""
-    response = get(endpoint, base_url=API_BASE_URL)
+def make_get_request(api_response, api_cache, endpoint):
+    """Realizar una petición GET al endpoint especificado.
+
+    Escenarios que consultan el mismo endpoint reutilizan la respuesta cacheada
+    en lugar de repetir la petición de red.
+    """
+    cache_key = ("GET", endpoint)
+
+    if cache_key in api_cache:
+        response = api_cache[cache_key]
+    else:
+        response = get(endpoint, base_url=API_BASE_URL)
+        api_cache[cache_key] = response
+
     # Guardar la respuesta en el fixture para usarla en pasos posteriores
     api_response["response"] = response
-    api_response["data"] = response.json()
+    api_response["data"] = parse_json_response(response)
 
 @then(parsers.parse('debo recibir un código de estado {status_code:d}'))
 def verify_status_code(api_response, status_code):
@@ -61,17 +99,12 @@ def verify_status_code(api_response, status_code):
         f"Se esperaba código de estado {status_code}, pero se recibió {api_response['response'].status_code}"
 
 @then(parsers.parse('la respuesta debe contener los datos del usuario con id {user_id:d}'))
-def verify_user_data(api_response, user_id):
+def verify_user_data(api_response, user_data_bucket, user_id):
     """Verificar que la respuesta contiene los datos del usuario especificado."""
     user_data = api_response["data"]
     assert user_data["id"] == user_id, f"Se esperaba usuario con id {user_id}, pero se recibió {user_data['id']}"
     assert "name" in user_data, "Los datos del usuario no contienen el campo 'name'"
     assert "email" in user_data, "Los datos del usuario no contienen el campo 'email'"
-    
-    # Guardar la respuesta en un archivo para referencia
-    report_dir = os.path.join(os.path.dirname(__file__), "../../../../Reports")
-    if not os.path.exists(report_dir):
-        os.makedirs(report_dir)
-        
-    with open(os.path.join(report_dir, f"user_{user_id}_data.json"), "w") as f:
-        json.dump(user_data, f, indent=4)
+
+    # Acumular el payload en memoria; se persiste una sola vez al final de la sesión
+    user_data_bucket[user_id] = user_data
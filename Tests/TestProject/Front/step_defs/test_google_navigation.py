@@ -9,10 +9,7 @@ from pytest_bdd import scenarios, given, when, then, parsers
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
-# Importaciones locales
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), "../../../.."))
+# Importaciones locales (el conftest.py raíz añade el proyecto a sys.path)
 from Utils.selenium_utils import setup_chrome_driver, wait_for_element, take_screenshot
 
 # ================================================================================================================================================ #
@@ -33,12 +30,24 @@ scenarios('../features/google_navigation.feature')
 # FIXTURES
 # ================================================================================================================================================ #
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def browser():
+    """Instancia de Chrome compartida por toda la sesión para evitar arrancar el navegador en cada escenario."""
     driver = setup_chrome_driver()
     yield driver
     driver.quit()
 
+@pytest.fixture(autouse=True)
+def reset_browser(browser):
+    """Limpia el estado del navegador entre escenarios (cookies y página en blanco).
+
+    La fixture `browser` tiene scope de sesión, por lo que no debe acumular estado
+    mutable de un test a otro; este reset garantiza escenarios independientes.
+    """
+    yield
+    browser.delete_all_cookies()
+    browser.get("about:blank")
+
 # ================================================================================================================================================ #
 # STEP DEFINITIONS
 # ================================================================================================================================================ #
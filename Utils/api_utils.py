@@ -36,9 +36,19 @@ import os
 import json
 import logging
 import requests
-import jsonschema
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+# orjson es opcional: parser JSON implementado en C, varias veces más rápido que la stdlib.
+# Si no está instalado se usa el parser estándar de requests/json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Importaciones locales
 from .config import API_BASE_URL, DEFAULT_TIMEOUT
@@ -47,12 +57,68 @@ from .config import API_BASE_URL, DEFAULT_TIMEOUT
 # CONSTANTS
 # ================================================================================================================================================ #
 
+# Logger del módulo (formateo perezoso: los argumentos solo se interpolan si el nivel está activo)
+log = logging.getLogger(__name__)
+
 # Headers comunes
 DEFAULT_HEADERS = {
     "Content-Type": "application/json",
     "Accept": "application/json"
 }
 
+# Opciones por defecto de las peticiones, construidas una sola vez a nivel de módulo.
+# Los headers no figuran aquí: los aplica la sesión compartida cuando no se especifican
+DEFAULT_OPTS = {
+    "timeout": DEFAULT_TIMEOUT,
+    "verify": True
+}
+
+# ================================================================================================================================================ #
+# HTTP SESSION
+# ================================================================================================================================================ #
+
+# Sesión HTTP compartida a nivel de módulo con pool de conexiones y reintentos.
+# Reutilizar la misma sesión permite que keep-alive mantenga abiertas las conexiones TCP/TLS
+# entre peticiones, evitando el coste del handshake en cada llamada.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+_SESSION.headers.update(DEFAULT_HEADERS)
+
+def close_session():
+    """
+    Cierra la sesión HTTP compartida y libera las conexiones del pool.
+
+    Pensada para ser llamada al finalizar la ejecución de los tests
+    (por ejemplo, desde una fixture de pytest con scope de sesión).
+    """
+    _SESSION.close()
+
+def _warm_one(url):
+    """Lanza una petición HEAD para abrir la conexión TCP/TLS; los errores se ignoran."""
+    try:
+        _SESSION.head(url, timeout=DEFAULT_TIMEOUT)
+    except Exception:
+        pass
+
+def warm_up_session(urls):
+    """
+    Precalienta el pool de conexiones lanzando peticiones HEAD en segundo plano.
+
+    No bloquea: cuando el primer escenario llegue a ejecutarse, el handshake TLS
+    con cada host ya estará hecho y el socket disponible en el pool.
+
+    Args:
+        urls (list): URLs base cuyos hosts se quieren precalentar
+    """
+    executor = ThreadPoolExecutor(max_workers=4)
+    for url in urls:
+        executor.submit(_warm_one, url)
+    executor.shutdown(wait=False)
+
 # ================================================================================================================================================ #
 # API REQUEST FUNCTIONS
 # ================================================================================================================================================ #
@@ -77,46 +143,41 @@ def make_request(method, endpoint, params=None, data=None, headers=None, timeout
     Raises:
         RequestException: Si ocurre un error en la petición
     """
-    # Usar valores por defecto si no se especifican
-    if timeout is None:
-        timeout = DEFAULT_TIMEOUT
-    
-    if headers is None:
-        headers = DEFAULT_HEADERS.copy()
-    
     if base_url is None:
         base_url = API_BASE_URL
-    
+
     # Construir URL completa
     url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-    
+
     # Convertir data a JSON si es un diccionario
     json_data = None
     if data and isinstance(data, dict):
         json_data = data
         data = None
-    
+
+    # Combinar las opciones por defecto con los argumentos realmente especificados;
+    # si no se pasan headers, se aplican los de la sesión sin copiar el diccionario
+    opts = {**DEFAULT_OPTS, **{key: value for key, value in (
+        ("params", params),
+        ("data", data),
+        ("json", json_data),
+        ("headers", headers),
+        ("timeout", timeout),
+        ("verify", verify)
+    ) if value is not None}}
+
     try:
-        # Realizar la petición
-        logging.info(f"Realizando petición {method} a {url}")
-        response = requests.request(
-            method=method,
-            url=url,
-            params=params,
-            data=data,
-            json=json_data,
-            headers=headers,
-            timeout=timeout,
-            verify=verify
-        )
-        
+        # Realizar la petición reutilizando la sesión compartida
+        log.info("Realizando petición %s a %s", method, url)
+        response = _SESSION.request(method, url, **opts)
+
         # Registrar información de la respuesta
         log_response(response)
-        
+
         return response
-    
+
     except RequestException as e:
-        logging.error(f"Error en petición {method} a {url}: {e}")
+        log.error("Error en petición %s a %s: %s", method, url, e)
         raise
 
 def get(endpoint, params=None, headers=None, timeout=None, verify=True, base_url=None):
@@ -136,6 +197,26 @@ def get(endpoint, params=None, headers=None, timeout=None, verify=True, base_url
     """
     return make_request("GET", endpoint, params=params, headers=headers, timeout=timeout, verify=verify, base_url=base_url)
 
+def head(endpoint, params=None, headers=None, timeout=None, verify=True, base_url=None):
+    """
+    Realiza una petición HEAD.
+
+    Útil para comprobaciones de conectividad: devuelve solo los headers,
+    sin descargar el cuerpo de la respuesta.
+
+    Args:
+        endpoint (str): Endpoint de la API
+        params (dict, optional): Parámetros de query string
+        headers (dict, optional): Headers HTTP
+        timeout (int, optional): Timeout en segundos
+        verify (bool, optional): Verificar certificado SSL
+        base_url (str, optional): URL base para la petición
+
+    Returns:
+        requests.Response: Objeto de respuesta
+    """
+    return make_request("HEAD", endpoint, params=params, headers=headers, timeout=timeout, verify=verify, base_url=base_url)
+
 def post(endpoint, data=None, params=None, headers=None, timeout=None, verify=True, base_url=None):
     """
     Realiza una petición POST.
@@ -193,6 +274,23 @@ def delete(endpoint, params=None, headers=None, timeout=None, verify=True, base_
 # HELPER FUNCTIONS
 # ================================================================================================================================================ #
 
+def parse_json_response(response):
+    """
+    Parsea el cuerpo JSON de una respuesta, usando orjson si está disponible.
+
+    Args:
+        response (requests.Response): Objeto de respuesta
+
+    Returns:
+        any: Datos parseados del cuerpo de la respuesta
+
+    Raises:
+        ValueError: Si el cuerpo no es JSON válido
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 def log_response(response):
     """
     Registra información sobre la respuesta HTTP.
@@ -200,58 +298,106 @@ def log_response(response):
     Args:
         response (requests.Response): Objeto de respuesta
     """
-    logging.info(f"Respuesta: {response.status_code} {response.reason}")
-    logging.debug(f"Headers: {response.headers}")
-    
-    try:
-        logging.debug(f"Contenido: {response.json()}")
-    except ValueError:
-        logging.debug(f"Contenido: {response.text[:200]}...")
+    log.info("Respuesta: %s %s", response.status_code, response.reason)
+
+    # Parsear el cuerpo solo si el nivel DEBUG está activo: en ejecuciones con nivel
+    # INFO (el habitual) esto evita un parseo JSON completo por petición
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Headers: %s", response.headers)
+        try:
+            log.debug("Contenido: %s", parse_json_response(response))
+        except ValueError:
+            log.debug("Contenido: %s...", response.text[:200])
+
+@lru_cache(maxsize=32)
+def _compiled_validator(schema_json):
+    """
+    Compila un esquema JSON en un validador reutilizable.
+
+    jsonschema.validate recompila el esquema en cada invocación; cachear el
+    validador por esquema serializado reduce N validaciones a una compilación.
+
+    Args:
+        schema_json (str): Esquema serializado como JSON con claves ordenadas
+
+    Returns:
+        jsonschema.Draft7Validator: Validador compilado
+    """
+    # Import diferido: jsonschema solo se paga cuando se valida un esquema
+    import jsonschema
+    return jsonschema.Draft7Validator(json.loads(schema_json))
 
 def validate_json_schema(data, schema):
     """
     Valida que los datos cumplan con un esquema JSON.
-    
+
+    El validador compilado se cachea por esquema, por lo que validar muchas
+    respuestas contra el mismo esquema solo paga la compilación una vez.
+
     Args:
         data (dict): Datos a validar
         schema (dict): Esquema JSON para validación
-        
+
     Returns:
         bool: True si los datos son válidos, False en caso contrario
-        
+
     Raises:
         jsonschema.exceptions.ValidationError: Si los datos no cumplen con el esquema
     """
+    import jsonschema
+
+    validator = _compiled_validator(json.dumps(schema, sort_keys=True))
+
     try:
-        jsonschema.validate(instance=data, schema=schema)
+        validator.validate(data)
         return True
     except jsonschema.exceptions.ValidationError as e:
-        logging.error(f"Error de validación de esquema: {e}")
+        log.error("Error de validación de esquema: %s", e)
         raise
 
+@lru_cache(maxsize=256)
+def _parse_path(key_path):
+    """
+    Parsea una ruta de claves en una tupla de pares (indice, clave).
+
+    El resultado se cachea con lru_cache para que rutas repetidas no vuelvan a
+    pagar el split ni las comprobaciones isdigit. Los tokens numéricos conservan
+    la clave original como cadena: el entero solo aplica al indexar listas, y los
+    objetos JSON con claves numéricas ("0", "1", ...) se consultan con la cadena.
+
+    Args:
+        key_path (str): Ruta de claves separadas por puntos (ej: "data.items.0.id")
+
+    Returns:
+        tuple: Pares (int|None, str) listos para indexar la respuesta
+    """
+    return tuple((int(key), key) if key.isdigit() else (None, key) for key in key_path.split('.'))
+
 def extract_data(response, key_path=None):
     """
     Extrae datos de una respuesta JSON usando una ruta de claves.
-    
+
+    Acepta tanto un objeto de respuesta como datos ya parseados (dict o list);
+    en el segundo caso no se vuelve a parsear el cuerpo, de modo que extraer
+    varias rutas de la misma respuesta solo paga un parseo.
+
     Args:
-        response (requests.Response): Objeto de respuesta
+        response (requests.Response | dict | list): Objeto de respuesta o datos ya parseados
         key_path (str, optional): Ruta de claves separadas por puntos (ej: "data.items.0.id")
-        
+
     Returns:
         any: Valor extraído o None si no se encuentra
     """
     try:
-        data = response.json()
-        
+        data = response if isinstance(response, (dict, list)) else parse_json_response(response)
+
         if not key_path:
             return data
-            
-        keys = key_path.split('.')
+
         result = data
-        
-        for key in keys:
-            if key.isdigit() and isinstance(result, list):
-                index = int(key)
+
+        for index, key in _parse_path(key_path):
+            if index is not None and isinstance(result, list):
                 if 0 <= index < len(result):
                     result = result[index]
                 else:
@@ -260,11 +406,11 @@ def extract_data(response, key_path=None):
                 result = result[key]
             else:
                 return None
-                
+
         return result
-        
+
     except (ValueError, KeyError, IndexError) as e:
-        logging.error(f"Error al extraer datos: {e}")
+        log.error("Error al extraer datos: %s", e)
         return None
 
 # ================================================================================================================================================ #
@@ -35,36 +35,43 @@ La configuración está diseñada para ser modular y adaptable a diferentes ento
 import os
 import sys
 import json
-import yaml
-import platform
+from pathlib import Path
+from functools import lru_cache
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # ================================================================================================================================================ #
 # CONSTANTS
 # ================================================================================================================================================ #
 
-# Detección del Sistema Operativo
-OP_SYS = "mac" if "mac" in platform.platform().lower() else "linux"
-if "windows" in platform.platform().lower(): OP_SYS = "windows"
-PATH_SEPARATOR = "\\" if OP_SYS == "windows" else "/"
+# Detección del Sistema Operativo (sys.platform es una constante ya calculada;
+# evita las llamadas a platform.platform(), que pueden lanzar subprocesos)
+OP_SYS = {"darwin": "mac", "win32": "windows"}.get(sys.platform, "linux")
 
-# Rutas de directorios
-CURRENT_FOLDER = os.path.dirname(os.path.abspath(__file__)) + PATH_SEPARATOR
-MAIN_FOLDER = f"{CURRENT_FOLDER}..{PATH_SEPARATOR}"
-WEBDRIVERS_FOLDER = f"{MAIN_FOLDER}Webdrivers{PATH_SEPARATOR}"
-ASSETS_FOLDER = f"{MAIN_FOLDER}Assets{PATH_SEPARATOR}"
-TESTS_FOLDER = f"{MAIN_FOLDER}Tests{PATH_SEPARATOR}"
-REPORTS_FOLDER = f"{MAIN_FOLDER}Reports{PATH_SEPARATOR}"
+# Rutas de directorios (objetos Path; pathlib gestiona los separadores de cada SO)
+CURRENT_FOLDER = Path(__file__).resolve().parent
+MAIN_FOLDER = CURRENT_FOLDER.parent
+WEBDRIVERS_FOLDER = MAIN_FOLDER / "Webdrivers"
+ASSETS_FOLDER = MAIN_FOLDER / "Assets"
+TESTS_FOLDER = MAIN_FOLDER / "Tests"
+REPORTS_FOLDER = MAIN_FOLDER / "Reports"
+SCREENSHOTS_FOLDER = REPORTS_FOLDER / "screenshots"
 
 # Webdrivers según sistema operativo
-WEBDRIVER_PATH = f"{WEBDRIVERS_FOLDER}{'Windows' if OP_SYS == 'windows' else 'Unix'}{PATH_SEPARATOR}"
+WEBDRIVER_PATH = WEBDRIVERS_FOLDER / ("Windows" if OP_SYS == "windows" else "Unix")
 
-# Carga de variables de entorno
-load_dotenv(f"{MAIN_FOLDER}.env")
+# Carga de variables de entorno (solo si existe el archivo .env, p. ej. no en contenedores de CI)
+_ENV_FILE = MAIN_FOLDER / ".env"
+if _ENV_FILE.exists():
+    load_dotenv(_ENV_FILE)
 
 # Entorno de ejecución
 ENV = os.environ.get("ENVIRONMENT", "TEST")
 HEADLESS = os.environ.get("HEADLESS", "TRUE").upper() == "TRUE"
+# Cargar imágenes en el navegador (desactivado por defecto: los tests solo validan el DOM)
+LOAD_IMAGES = os.environ.get("LOAD_IMAGES", "FALSE").upper() == "TRUE"
+# Capturar screenshots en cada paso (desactivado por defecto; ante fallos siempre se captura)
+CAPTURE_SCREENSHOTS = os.environ.get("CAPTURE_SCREENSHOTS", "FALSE").upper() in ("1", "TRUE")
 
 # Timeouts y esperas
 DEFAULT_TIMEOUT = int(os.environ.get("DEFAULT_TIMEOUT", "30"))
@@ -79,18 +86,22 @@ API_BASE_URL = os.environ.get("API_BASE_URL", "https://jsonplaceholder.typicode.
 # FUNCTIONS
 # ================================================================================================================================================ #
 
+@lru_cache(maxsize=1)
 def get_config():
     """
     Devuelve un diccionario con todas las configuraciones actuales.
-    
+
+    El resultado se construye una sola vez y se devuelve como vista de solo lectura,
+    de modo que llamadas repetidas desde fixtures no realojen el diccionario.
+
     Returns:
-        dict: Configuración completa del framework
+        MappingProxyType: Configuración completa del framework (solo lectura)
     """
-    return {
+    return MappingProxyType({
         "os": OP_SYS,
         "env": ENV,
         "headless": HEADLESS,
-        "webdriver_path": WEBDRIVER_PATH,
+        "webdriver_path": str(WEBDRIVER_PATH),
         "timeouts": {
             "default": DEFAULT_TIMEOUT,
             "implicit_wait": IMPLICIT_WAIT,
@@ -100,26 +111,30 @@ def get_config():
             "base": BASE_URL,
             "api": API_BASE_URL
         }
-    }
+    })
 
-def load_config_file(config_file):
+@lru_cache(maxsize=8)
+def _load_config_file_cached(config_file, mtime):
     """
-    Carga configuración desde un archivo JSON o YAML.
-    
+    Parsea un archivo de configuración JSON o YAML.
+
+    Se cachea por (ruta, mtime): el parámetro mtime invalida la entrada
+    automáticamente cuando el archivo cambia en disco.
+
     Args:
-        config_file (str): Ruta al archivo de configuración
-        
+        config_file (str): Ruta absoluta al archivo de configuración
+        mtime (float): Fecha de modificación del archivo
+
     Returns:
         dict: Configuración cargada desde el archivo
     """
-    if not os.path.exists(config_file):
-        return {}
-        
     try:
         if config_file.endswith('.json'):
             with open(config_file, 'r') as f:
                 return json.load(f)
         elif config_file.endswith(('.yaml', '.yml')):
+            # Import diferido: yaml solo se paga cuando realmente se carga un archivo YAML
+            import yaml
             with open(config_file, 'r') as f:
                 return yaml.safe_load(f)
         else:
@@ -128,15 +143,32 @@ def load_config_file(config_file):
         print(f"Error loading config file: {e}")
         return {}
 
+def load_config_file(config_file):
+    """
+    Carga configuración desde un archivo JSON o YAML, evitando reparsearlo
+    en llamadas repetidas mientras el archivo no cambie.
+
+    Args:
+        config_file (str): Ruta al archivo de configuración
+
+    Returns:
+        dict: Configuración cargada desde el archivo
+    """
+    config_file = os.path.abspath(config_file)
+
+    if not os.path.exists(config_file):
+        return {}
+
+    return _load_config_file_cached(config_file, os.path.getmtime(config_file))
+
 def create_folder_if_not_exists(folder_path):
     """
     Crea una carpeta si no existe.
-    
+
     Args:
-        folder_path (str): Ruta de la carpeta a crear
+        folder_path (str | Path): Ruta de la carpeta a crear
     """
-    if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
+    Path(folder_path).mkdir(parents=True, exist_ok=True)
 
 # Crear carpetas necesarias si no existen
 create_folder_if_not_exists(REPORTS_FOLDER)
@@ -146,4 +178,4 @@ create_folder_if_not_exists(REPORTS_FOLDER)
 # ================================================================================================================================================ #
 
 if __name__ == "__main__":
-    print(json.dumps(get_config(), indent=4))
+    print(json.dumps(dict(get_config()), indent=4))
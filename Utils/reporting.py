@@ -34,29 +34,82 @@ la ejecución de las pruebas automatizadas.
 
 import os
 import json
+import time
 import logging
 import datetime
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson es opcional: serializador JSON implementado en Rust, varias veces más rápido
+# que la stdlib. Si no está instalado se usa json.dump
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numpy y numba son opcionales: solo compensan al agregar lotes muy grandes de
+# resultados (tests data-driven con cientos de miles de registros)
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:
+    np = None
 
 # Importaciones locales
-from .config import REPORTS_FOLDER
+from .config import REPORTS_FOLDER, SCREENSHOTS_FOLDER
 
 # ================================================================================================================================================ #
 # CONSTANTS
 # ================================================================================================================================================ #
 
+# Logger del módulo (formateo perezoso: los argumentos solo se interpolan si el nivel está activo)
+log = logging.getLogger(__name__)
+
 # Formatos de reporte disponibles
 REPORT_FORMATS = ["html", "json", "xml"]
 
-# Carpeta para reportes
-HTML_REPORTS_FOLDER = os.path.join(REPORTS_FOLDER, "html")
-JSON_REPORTS_FOLDER = os.path.join(REPORTS_FOLDER, "json")
-SCREENSHOTS_FOLDER = os.path.join(REPORTS_FOLDER, "screenshots")
+# Carpeta para reportes; SCREENSHOTS_FOLDER es la constante compartida de config.py,
+# de modo que todos los módulos apuntan a la misma carpeta de capturas
+HTML_REPORTS_FOLDER = REPORTS_FOLDER / "html"
+JSON_REPORTS_FOLDER = REPORTS_FOLDER / "json"
 
-# Crear carpetas si no existen
+# Crear carpetas si no existen (exist_ok evita el stat previo: una sola syscall atómica)
 for folder in [HTML_REPORTS_FOLDER, JSON_REPORTS_FOLDER, SCREENSHOTS_FOLDER]:
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+    os.makedirs(folder, exist_ok=True)
+
+# Carpetas ya creadas durante esta ejecución, para no repetir la syscall de mkdir
+_CREATED_DIRS = set()
+
+# Estado para desambiguar nombres de reporte generados dentro del mismo segundo
+_LAST_TS = ""
+_TS_COUNTER = 0
+_TS_LOCK = threading.Lock()
+
+# Mapeo de estados a códigos enteros para la agregación compilada
+_STATUS_CODES = {"passed": 0, "failed": 1, "skipped": 2}
+
+# Número de resultados a partir del cual la ruta compilada con numba compensa
+# el coste de convertir los datos a arrays
+_NUMBA_THRESHOLD = 100_000
+
+if np is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _aggregate(statuses, durations):
+        """Cuenta estados y suma duraciones sobre arrays contiguos, sin GIL y en paralelo."""
+        passed = 0
+        failed = 0
+        skipped = 0
+        duration = 0.0
+        for i in prange(statuses.shape[0]):
+            status = statuses[i]
+            if status == 0:
+                passed += 1
+            elif status == 1:
+                failed += 1
+            elif status == 2:
+                skipped += 1
+            duration += durations[i]
+        return passed, failed, skipped, duration
 
 # ================================================================================================================================================ #
 # REPORTING FUNCTIONS
@@ -65,16 +118,33 @@ for folder in [HTML_REPORTS_FOLDER, JSON_REPORTS_FOLDER, SCREENSHOTS_FOLDER]:
 def generate_report_filename(prefix="report", extension="html"):
     """
     Genera un nombre de archivo para un reporte basado en la fecha y hora actual.
-    
+
+    Si se generan varios reportes dentro del mismo segundo, se añade un contador
+    incremental al nombre para evitar sobrescrituras; el estado compartido está
+    protegido con un lock, por lo que es seguro en ejecuciones con hilos.
+
     Args:
         prefix (str, optional): Prefijo para el nombre del archivo
         extension (str, optional): Extensión del archivo
-        
+
     Returns:
         str: Nombre de archivo generado
     """
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"{prefix}_{timestamp}.{extension}"
+    global _LAST_TS, _TS_COUNTER
+
+    # time.strftime es C puro: evita crear un objeto datetime por archivo
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+
+    with _TS_LOCK:
+        if timestamp == _LAST_TS:
+            _TS_COUNTER += 1
+            suffix = f"_{_TS_COUNTER}"
+        else:
+            _LAST_TS = timestamp
+            _TS_COUNTER = 0
+            suffix = ""
+
+    return f"{prefix}_{timestamp}{suffix}.{extension}"
 
 def save_json_report(data, filename=None):
     """
@@ -89,100 +159,220 @@ def save_json_report(data, filename=None):
     """
     if filename is None:
         filename = generate_report_filename("report", "json")
-    
+
     file_path = os.path.join(JSON_REPORTS_FOLDER, filename)
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
-    
-    logging.info(f"Reporte JSON guardado en: {file_path}")
+
+    # Buffer de escritura de 1 MiB: los reportes grandes salen en pocas llamadas
+    # write() al sistema en lugar de muchas escrituras de 8 KiB
+    if orjson is not None:
+        # default=str cubre tipos no soportados (p. ej. Path); los timestamps se
+        # mantienen como cadenas ISO para que el reporte sea idéntico con ambos motores
+        with open(file_path, 'wb', buffering=1 << 20) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
+    else:
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            json.dump(data, f, indent=4, default=str)
+
+    log.info("Reporte JSON guardado en: %s", file_path)
     return file_path
 
-def create_test_result(test_name, status, duration=None, error=None, screenshots=None):
+def create_test_result(test_name, status, duration=None, error=None, screenshots=None, _now=datetime.datetime.now):
     """
     Crea un diccionario con el resultado de un test.
-    
+
+    _now liga datetime.datetime.now como variable local, ahorrando dos búsquedas
+    de atributo por registro; el diccionario se construye en una sola pasada
+    filtrando los campos opcionales no informados.
+
     Args:
         test_name (str): Nombre del test
         status (str): Estado del test (passed, failed, skipped)
         duration (float, optional): Duración del test en segundos
         error (str, optional): Mensaje de error si el test falló
         screenshots (list, optional): Lista de rutas de screenshots
-        
+
     Returns:
         dict: Resultado del test
     """
-    result = {
-        "name": test_name,
-        "status": status,
-        "timestamp": datetime.datetime.now().isoformat(),
-    }
-    
-    if duration is not None:
-        result["duration"] = duration
-    
-    if error is not None:
-        result["error"] = error
-    
-    if screenshots is not None:
-        result["screenshots"] = screenshots
-    
-    return result
+    return {key: value for key, value in (
+        ("name", test_name),
+        ("status", status),
+        ("timestamp", _now().isoformat()),
+        ("duration", duration),
+        ("error", error),
+        ("screenshots", screenshots)
+    ) if value is not None}
+
+class AccumulatingStats:
+    """
+    Acumulador incremental de estadísticas de tests.
+
+    Permite registrar resultados a medida que terminan (memoria O(1), inserción O(1))
+    en lugar de materializar la lista completa y recorrerla después. add() está
+    protegido con un lock, por lo que es seguro alimentarlo desde varios hilos.
+    """
+
+    __slots__ = ("total", "passed", "failed", "skipped", "duration", "_lock")
+
+    def __init__(self):
+        self.total = 0
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, result):
+        """
+        Registra un resultado de test.
+
+        Args:
+            result (dict): Resultado creado con create_test_result
+        """
+        status = result["status"]
+
+        with self._lock:
+            self.total += 1
+            if status in ("passed", "failed", "skipped"):
+                setattr(self, status, getattr(self, status) + 1)
+            self.duration += result.get("duration", 0.0)
+
+    def finalize(self):
+        """
+        Devuelve las estadísticas acumuladas hasta el momento.
+
+        La instantánea se toma bajo el mismo lock que add(), de modo que nunca
+        refleja un resultado a medio registrar.
+
+        Returns:
+            dict: Estadísticas con el mismo formato que collect_test_results
+        """
+        with self._lock:
+            stats = {
+                "total": self.total,
+                "passed": self.passed,
+                "failed": self.failed,
+                "skipped": self.skipped,
+                "duration": self.duration
+            }
+
+        stats["success_rate"] = (stats["passed"] / stats["total"]) * 100 if stats["total"] > 0 else 0
+
+        return stats
 
 def collect_test_results(results):
     """
     Recopila estadísticas de resultados de tests.
-    
+
+    Es un envoltorio de AccumulatingStats para listas ya materializadas; para
+    resultados producidos incrementalmente, usar el acumulador directamente.
+
     Args:
         results (list): Lista de resultados de tests
-        
+
     Returns:
         dict: Estadísticas de los tests
     """
-    stats = {
-        "total": len(results),
-        "passed": 0,
-        "failed": 0,
-        "skipped": 0,
-        "duration": 0
-    }
-    
+    if not isinstance(results, (list, tuple)):
+        results = list(results)
+
+    # Para lotes muy grandes, convertir a arrays (Structure-of-Arrays) y agregar
+    # con la reducción compilada: LLVM vectoriza el bucle y lo reparte entre hilos
+    if np is not None and len(results) >= _NUMBA_THRESHOLD:
+        statuses = np.fromiter((_STATUS_CODES.get(result["status"], -1) for result in results), dtype=np.int8, count=len(results))
+        durations = np.fromiter((result.get("duration", 0.0) for result in results), dtype=np.float64, count=len(results))
+        passed, failed, skipped, duration = _aggregate(statuses, durations)
+
+        stats = {
+            "total": len(results),
+            "passed": int(passed),
+            "failed": int(failed),
+            "skipped": int(skipped),
+            "duration": float(duration)
+        }
+
+        stats["success_rate"] = (stats["passed"] / stats["total"]) * 100 if stats["total"] > 0 else 0
+
+        return stats
+
+    stats = AccumulatingStats()
     for result in results:
-        stats[result["status"]] += 1
-        if "duration" in result:
-            stats["duration"] += result["duration"]
-    
-    stats["success_rate"] = (stats["passed"] / stats["total"]) * 100 if stats["total"] > 0 else 0
-    
-    return stats
+        stats.add(result)
+
+    return stats.finalize()
+
+def _copy_screenshot(src, dst):
+    """
+    Copia un screenshot de la forma más barata posible.
+
+    Primero intenta un hardlink (cero bytes copiados cuando origen y destino
+    están en el mismo sistema de archivos); si falla, usa os.sendfile para que
+    la copia ocurra en el kernel en una sola llamada, y como último recurso
+    hace una copia binaria directa (plataformas sin sendfile).
+
+    Args:
+        src (str): Ruta del archivo original
+        dst (str): Ruta de destino
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    try:
+        size = os.stat(src).st_size
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            # sendfile puede transferir menos bytes de los pedidos: avanzar el
+            # offset hasta completar el archivo para no dejar copias truncadas
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                if sent == 0:
+                    raise OSError(f"sendfile no transfirió bytes en el offset {offset} de {src}")
+                offset += sent
+    except (AttributeError, OSError):
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            d.write(s.read())
 
 def organize_screenshots(test_name, screenshots):
     """
     Organiza screenshots en la carpeta correspondiente.
-    
+
     Args:
         test_name (str): Nombre del test
         screenshots (list): Lista de rutas de screenshots
-        
+
     Returns:
         list: Lista de rutas de screenshots organizados
     """
-    # Crear carpeta específica para el test
+    # Crear carpeta específica para el test (solo la primera vez que se ve)
     test_folder = os.path.join(SCREENSHOTS_FOLDER, test_name.replace(" ", "_"))
-    if not os.path.exists(test_folder):
-        os.makedirs(test_folder)
-    
-    organized_screenshots = []
-    
+    if test_folder not in _CREATED_DIRS:
+        os.makedirs(test_folder, exist_ok=True)
+        _CREATED_DIRS.add(test_folder)
+
+    # Filtrar los screenshots existentes y precalcular sus destinos.
+    # os.path.basename es C puro, frente a construir un objeto Path por archivo;
+    # los alias locales ahorran la búsqueda de atributo en cada iteración
+    basename = os.path.basename
+    join = os.path.join
+
+    pairs = []
     for i, screenshot in enumerate(screenshots):
         if os.path.exists(screenshot):
-            # Copiar screenshot a la carpeta del test
-            new_path = os.path.join(test_folder, f"step_{i+1}_{Path(screenshot).name}")
-            import shutil
-            shutil.copy2(screenshot, new_path)
-            organized_screenshots.append(new_path)
-    
-    return organized_screenshots
+            pairs.append((screenshot, join(test_folder, f"step_{i+1}_{basename(screenshot)}")))
+
+    if not pairs:
+        return []
+
+    # Las copias son independientes y están limitadas por E/S: despacharlas en paralelo
+    # acerca el tiempo total al de la copia más lenta en lugar de a la suma de todas
+    with ThreadPoolExecutor(max_workers=min(32, len(pairs))) as executor:
+        list(executor.map(lambda pair: _copy_screenshot(*pair), pairs))
+
+    # pairs conserva el orden original, por lo que el resultado también
+    return [new_path for _, new_path in pairs]
 
 # ================================================================================================================================================ #
 # MAIN EXECUTION
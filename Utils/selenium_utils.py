@@ -34,28 +34,43 @@ una capa de abstracción sobre las funcionalidades básicas de Selenium.
 
 import os
 import time
+import base64
 import logging
-from datetime import datetime
+from weakref import WeakKeyDictionary
 from selenium import webdriver
+from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 
 # Importaciones locales
-from .config import WEBDRIVER_PATH, HEADLESS, DEFAULT_TIMEOUT, IMPLICIT_WAIT, PAGE_LOAD_TIMEOUT, OP_SYS, REPORTS_FOLDER
+from .config import WEBDRIVER_PATH, HEADLESS, LOAD_IMAGES, CAPTURE_SCREENSHOTS, DEFAULT_TIMEOUT, PAGE_LOAD_TIMEOUT, OP_SYS, SCREENSHOTS_FOLDER
 
 # ================================================================================================================================================ #
 # CONSTANTS
 # ================================================================================================================================================ #
 
-SCREENSHOTS_FOLDER = f"{REPORTS_FOLDER}screenshots/"
+# Asegurar que existe la carpeta de screenshots (una sola syscall atómica)
+os.makedirs(SCREENSHOTS_FOLDER, exist_ok=True)
 
-# Asegurar que existe la carpeta de screenshots
-if not os.path.exists(SCREENSHOTS_FOLDER):
-    os.makedirs(SCREENSHOTS_FOLDER)
+# Logger del módulo (formateo perezoso: los argumentos solo se interpolan si el nivel está activo)
+log = logging.getLogger(__name__)
+
+# Ruta del chromedriver resuelta por webdriver-manager, cacheada tras la primera
+# llamada: install() sondea versiones en red/disco y cuesta cientos de ms por driver
+_CACHED_DRIVER_PATH = None
+
+# Argumentos fijos de Chrome, definidos una sola vez; setup_chrome_driver solo
+# añade por llamada las partes dinámicas (headless, imágenes, prefs de descargas)
+_BASE_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--window-size=1920,1080"
+)
 
 # ================================================================================================================================================ #
 # WEBDRIVER SETUP
@@ -80,13 +95,20 @@ def setup_chrome_driver(headless=None, download_dir=None):
     chrome_options = Options()
     
     if headless:
-        chrome_options.add_argument("--headless")
-    
+        chrome_options.add_argument("--headless=new")
+
     # Configuraciones comunes
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
+    for argument in _BASE_ARGS:
+        chrome_options.add_argument(argument)
+
+    # No descargar imágenes salvo que se pida explícitamente (LOAD_IMAGES=TRUE):
+    # los tests validan título y presencia de elementos, no el renderizado
+    if not LOAD_IMAGES:
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+    # Estrategia de carga "eager": devolver el control al alcanzar DOMContentLoaded,
+    # sin esperar a recursos externos (imágenes, iframes, etc.)
+    chrome_options.page_load_strategy = "eager"
     
     # Configurar directorio de descargas si se especifica
     if download_dir:
@@ -98,13 +120,21 @@ def setup_chrome_driver(headless=None, download_dir=None):
         }
         chrome_options.add_experimental_option("prefs", prefs)
     
+    global _CACHED_DRIVER_PATH
+
     try:
-        # Intentar usar webdriver-manager para gestionar el driver
-        service = Service(ChromeDriverManager().install())
+        # Intentar usar webdriver-manager para gestionar el driver; la ruta resuelta
+        # se cachea para que los siguientes drivers arranquen sin volver a sondear
+        if _CACHED_DRIVER_PATH is None or not os.path.exists(_CACHED_DRIVER_PATH):
+            # Import diferido: webdriver-manager solo se paga al crear el primer driver
+            from webdriver_manager.chrome import ChromeDriverManager
+            _CACHED_DRIVER_PATH = ChromeDriverManager().install()
+
+        service = Service(_CACHED_DRIVER_PATH)
         driver = webdriver.Chrome(service=service, options=chrome_options)
     except Exception as e:
-        logging.warning(f"Error al usar webdriver-manager: {e}")
-        logging.info("Intentando usar webdriver local...")
+        log.warning("Error al usar webdriver-manager: %s", e)
+        log.info("Intentando usar webdriver local...")
         
         # Intentar usar webdriver local
         chrome_driver = "chromedriver.exe" if OP_SYS == "windows" else "chromedriver"
@@ -116,8 +146,10 @@ def setup_chrome_driver(headless=None, download_dir=None):
         else:
             raise FileNotFoundError(f"No se encontró el webdriver en {driver_path}")
     
-    # Configurar timeouts
-    driver.implicitly_wait(IMPLICIT_WAIT)
+    # Configurar timeouts. Política de esperas explícitas: la espera implícita se fija
+    # a 0 porque se acumula con los WebDriverWait y duplica los timeouts; además hace
+    # que is_element_present bloquee varios segundos en cada aserción negativa
+    driver.implicitly_wait(0)
     driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
     
     return driver
@@ -126,26 +158,61 @@ def setup_chrome_driver(headless=None, download_dir=None):
 # HELPER FUNCTIONS
 # ================================================================================================================================================ #
 
+# Caché de objetos WebDriverWait por driver y timeout; al ser débil por clave,
+# las entradas desaparecen solas cuando el driver se destruye
+_WAIT_CACHE = WeakKeyDictionary()
+
+def _get_wait(driver, timeout):
+    """
+    Devuelve un WebDriverWait reutilizable para el par (driver, timeout).
+
+    Evita construir un objeto de espera nuevo en cada aserción; todos los waits
+    comparten el sondeo de 0.1 segundos usado por los helpers del módulo.
+
+    Args:
+        driver (webdriver): Instancia de Selenium WebDriver
+        timeout (int): Tiempo máximo de espera en segundos
+
+    Returns:
+        WebDriverWait: Objeto de espera cacheado
+    """
+    waits = _WAIT_CACHE.setdefault(driver, {})
+    wait = waits.get(timeout)
+
+    if wait is None:
+        wait = waits[timeout] = WebDriverWait(driver, timeout, poll_frequency=0.1)
+
+    return wait
+
 def wait_for_element(driver, locator, timeout=None):
     """
-    Espera a que un elemento esté presente en el DOM y sea visible.
-    
+    Espera a que un elemento esté presente en el DOM.
+
+    Usa una espera explícita con sondeo cada 0.1 segundos, por lo que el elemento
+    se detecta casi en cuanto aparece en lugar de esperar al siguiente tick de 500 ms.
+
     Args:
         driver (webdriver): Instancia de Selenium WebDriver
         locator (tuple): Tupla con el tipo de localizador y el valor (By.ID, "id_value")
         timeout (int, optional): Tiempo máximo de espera en segundos
-        
+
     Returns:
         WebElement: El elemento web encontrado
-        
+
     Raises:
         TimeoutException: Si el elemento no se encuentra en el tiempo especificado
     """
     if timeout is None:
         timeout = DEFAULT_TIMEOUT
-        
-    wait = WebDriverWait(driver, timeout)
-    return wait.until(EC.visibility_of_element_located(locator))
+
+    # Comprobación síncrona inmediata: si el elemento ya está en el DOM (el caso
+    # habitual en páginas rápidas) se devuelve sin pagar el intervalo de sondeo
+    try:
+        return driver.find_element(*locator)
+    except NoSuchElementException:
+        pass
+
+    return _get_wait(driver, timeout).until(EC.presence_of_element_located(locator))
 
 def wait_for_element_clickable(driver, locator, timeout=None):
     """
@@ -164,9 +231,17 @@ def wait_for_element_clickable(driver, locator, timeout=None):
     """
     if timeout is None:
         timeout = DEFAULT_TIMEOUT
-        
-    wait = WebDriverWait(driver, timeout)
-    return wait.until(EC.element_to_be_clickable(locator))
+
+    # Comprobación síncrona inmediata: si el elemento ya es visible y está habilitado
+    # se devuelve sin pagar el intervalo de sondeo; si no, se espera como siempre
+    try:
+        element = driver.find_element(*locator)
+        if element.is_displayed() and element.is_enabled():
+            return element
+    except NoSuchElementException:
+        pass
+
+    return _get_wait(driver, timeout).until(EC.element_to_be_clickable(locator))
 
 def safe_click(driver, locator, timeout=None):
     """
@@ -185,43 +260,132 @@ def safe_click(driver, locator, timeout=None):
         element.click()
         return True
     except Exception as e:
-        logging.error(f"Error al hacer click en {locator}: {e}")
+        log.error("Error al hacer click en %s: %s", locator, e)
         return False
 
-def take_screenshot(driver, name=None):
+def take_screenshot(driver, name=None, format="jpeg"):
     """
     Toma una captura de pantalla y la guarda en la carpeta de screenshots.
-    
+
+    Es un no-op salvo que CAPTURE_SCREENSHOTS esté activo: en escenarios que pasan,
+    las capturas nunca se consultan y sus escrituras a disco solo añaden latencia.
+    Las capturas ante fallos las gestiona el hook pytest_bdd_step_error del conftest.
+
+    Por defecto captura JPEG vía Chrome DevTools Protocol (payload más pequeño y sin
+    codificador PNG en Chrome); la calidad se controla con la variable de entorno
+    SS_QUALITY (70 por defecto). Con format="png" se usa la captura sin pérdida clásica.
+
     Args:
         driver (webdriver): Instancia de Selenium WebDriver
         name (str, optional): Nombre para el archivo. Si no se proporciona, se usa timestamp
-        
+        format (str, optional): Formato de la captura, "jpeg" o "png"
+
     Returns:
-        str: Ruta del archivo de screenshot guardado
+        str: Ruta del archivo de screenshot guardado, o None si la captura está desactivada
     """
+    if not CAPTURE_SCREENSHOTS:
+        return None
+
     if name is None:
-        name = f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    
+        # time.strftime es C puro: evita crear un objeto datetime por captura
+        name = f"screenshot_{time.strftime('%Y%m%d_%H%M%S')}"
+
+    # Con pytest-xdist, cada worker añade su identificador al nombre
+    # para que ejecuciones en paralelo no sobrescriban el mismo archivo
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id:
+        name = f"{name}_{worker_id}"
+
+    if format == "jpeg":
+        try:
+            quality = int(os.environ.get("SS_QUALITY", "70"))
+            data = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": quality})["data"]
+
+            if not name.endswith((".jpg", ".jpeg")):
+                name += ".jpg"
+
+            screenshot_path = os.path.join(SCREENSHOTS_FOLDER, name)
+            with open(screenshot_path, 'wb', buffering=1 << 20) as f:
+                f.write(base64.b64decode(data))
+
+            log.info("Screenshot guardado en: %s", screenshot_path)
+            return screenshot_path
+        except Exception as e:
+            # Drivers sin soporte CDP (p. ej. no-Chrome): usar la captura PNG clásica
+            log.warning("Captura vía CDP no disponible (%s); usando save_screenshot", e)
+
     if not name.endswith(".png"):
         name += ".png"
-        
+
     screenshot_path = os.path.join(SCREENSHOTS_FOLDER, name)
     driver.save_screenshot(screenshot_path)
-    logging.info(f"Screenshot guardado en: {screenshot_path}")
-    
+    log.info("Screenshot guardado en: %s", screenshot_path)
+
     return screenshot_path
 
-def is_element_present(driver, locator):
+def _locator_to_css(locator):
+    """
+    Convierte localizadores sencillos a un selector CSS, o None si no es posible.
+
+    Args:
+        locator (tuple): Tupla con el tipo de localizador y el valor
+
+    Returns:
+        str | None: Selector CSS equivalente, o None para tipos no soportados
+    """
+    by, value = locator
+
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.ID:
+        # Selector de atributo, igual que la traducción del propio Selenium: soporta ids
+        # con caracteres CSS significativos (p. ej. "user.name"); un id con comillas hace
+        # fallar el querySelector y cae a la ruta clásica de find_element
+        return f'[id="{value}"]'
+    if by == By.CLASS_NAME:
+        return f".{value}"
+    if by == By.NAME:
+        return f'[name="{value}"]'
+
+    return None
+
+def is_element_present(driver, locator, timeout=0):
     """
     Verifica si un elemento está presente en el DOM.
-    
+
+    Para localizadores CSS/ID/CLASS/NAME/XPATH la comprobación se hace con una única
+    llamada execute_script, sin construir ni desenrollar NoSuchElementException en
+    cada ausencia; el resto de tipos usa la ruta clásica de find_element.
+
     Args:
         driver (webdriver): Instancia de Selenium WebDriver
         locator (tuple): Tupla con el tipo de localizador y el valor (By.ID, "id_value")
-        
+        timeout (int, optional): Segundos a esperar por el elemento; 0 comprueba sin esperar
+
     Returns:
         bool: True si el elemento está presente, False en caso contrario
     """
+    if timeout > 0:
+        try:
+            wait_for_element(driver, locator, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    try:
+        if locator[0] == By.XPATH:
+            return bool(driver.execute_script(
+                "return document.evaluate(arguments[0], document, null, XPathResult.BOOLEAN_TYPE, null).booleanValue",
+                locator[1]
+            ))
+
+        css = _locator_to_css(locator)
+        if css is not None:
+            return bool(driver.execute_script("return !!document.querySelector(arguments[0])", css))
+    except Exception:
+        # Si el script falla (p. ej. selector con caracteres especiales), usar la ruta clásica
+        pass
+
     try:
         driver.find_element(*locator)
         return True
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+# ================================================================================================================================================ #
+# SYSTEM CONFIGURATION
+# ================================================================================================================================================ #
+
+# -*- coding: utf-8 -*-
+
+# ================================================================================================================================================ #
+# DESCRIPTION
+# ================================================================================================================================================ #
+
+"""
+conftest.py define fixtures y hooks de pytest compartidos por todos los tests del framework.
+"""
+
+# ================================================================================================================================================ #
+# IMPORTS
+# ================================================================================================================================================ #
+
+import json
+import pytest
+from collections import defaultdict
+
+# orjson es opcional; si no está instalado se usa el json de la stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Importaciones locales
+from Utils.api_utils import close_session, warm_up_session
+from Utils.config import REPORTS_FOLDER, SCREENSHOTS_FOLDER, BASE_URL, API_BASE_URL
+
+# ================================================================================================================================================ #
+# CONSTANTS
+# ================================================================================================================================================ #
+
+# Datos de usuario recopilados durante la sesión; se vuelcan a disco una sola vez al final
+_USER_DATA_BUCKET = defaultdict(dict)
+
+# Carpeta de capturas de error (constante compartida de config.py), creada una
+# única vez al importar el módulo
+SCREENSHOTS_FOLDER.mkdir(parents=True, exist_ok=True)
+
+# ================================================================================================================================================ #
+# FIXTURES
+# ================================================================================================================================================ #
+
+@pytest.fixture(scope="session", autouse=True)
+def http_session_teardown():
+    """Cierra la sesión HTTP compartida al finalizar la ejecución de los tests."""
+    yield
+    close_session()
+
+@pytest.fixture(scope="session")
+def user_data_bucket():
+    """Acumulador en memoria de payloads de usuario.
+
+    Los pasos de verificación guardan aquí los datos en lugar de escribir un archivo
+    por escenario; pytest_sessionfinish los persiste todos en una única escritura.
+    """
+    return _USER_DATA_BUCKET
+
+# ================================================================================================================================================ #
+# HOOKS
+# ================================================================================================================================================ #
+
+def pytest_sessionstart(session):
+    """Precalienta el pool de conexiones HTTP hacia los hosts objetivo.
+
+    Se lanza en segundo plano al arrancar la sesión para que el primer escenario
+    no pague el handshake TLS inicial.
+    """
+    warm_up_session([API_BASE_URL, BASE_URL])
+
+def pytest_bdd_step_error(request, feature, scenario, step, step_func, step_func_args, exception):
+    """Captura una screenshot únicamente cuando falla un paso que usa el navegador.
+
+    Las capturas por paso están desactivadas por defecto (ver CAPTURE_SCREENSHOTS
+    en Utils/config.py); aquí se toma una sola captura en memoria y se escribe
+    una vez por fallo, en lugar de escribir PNGs en cada paso que pasa.
+    """
+    driver = step_func_args.get("browser")
+    if driver is None:
+        return
+
+    try:
+        png = driver.get_screenshot_as_png()
+    except Exception:
+        return
+
+    name = f"error_{scenario.name.replace(' ', '_')}_{step.name.replace(' ', '_')[:50]}.png"
+    with open(SCREENSHOTS_FOLDER / name, "wb") as f:
+        f.write(png)
+
+def pytest_sessionfinish(session, exitstatus):
+    """Vuelca los datos de usuario acumulados a Reports/users.json en una sola escritura."""
+    if not _USER_DATA_BUCKET:
+        return
+
+    # REPORTS_FOLDER ya fue creada al importar Utils/config.py
+    report_path = REPORTS_FOLDER / "users.json"
+
+    if orjson is not None:
+        with open(report_path, "wb") as f:
+            f.write(orjson.dumps(dict(_USER_DATA_BUCKET), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(_USER_DATA_BUCKET, f, indent=4)